@@ -348,43 +348,50 @@ class AWSIoTArchitectureSetup:
 import json
 import boto3
 import time
+import logging
 from datetime import datetime
 
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# 初始化客户端（模块级创建，热容器内跨调用复用）
+s3 = boto3.client('s3')
+timestream = boto3.client('timestream-write')
+
 def lambda_handler(event, context):
     """处理IoT数据的Lambda函数"""
     
-    # 初始化客户端
-    s3 = boto3.client('s3')
-    timestream = boto3.client('timestream-write')
-    
     # 处理IoT消息
     device_id = event.get('deviceId', 'unknown')
     timestamp = str(int(time.time() * 1000))
     
     # 写入TimeStream
     try:
-        records = []
-        for key, value in event.get('metrics', {}).items():
-            records.append({
-                'Time': timestamp,
-                'TimeUnit': 'MILLISECONDS',
-                'Dimensions': [
-                    {'Name': 'deviceId', 'Value': device_id},
-                    {'Name': 'metricType', 'Value': key}
-                ],
-                'MeasureName': 'value',
-                'MeasureValue': str(value),
-                'MeasureValueType': 'DOUBLE'
-            })
+        # 所有指标共享的字段只发送一次，每条记录只保留指标类型和值
+        common_attributes = {
+            'Time': timestamp,
+            'TimeUnit': 'MILLISECONDS',
+            'Dimensions': [{'Name': 'deviceId', 'Value': device_id}],
+            'MeasureName': 'value',
+            'MeasureValueType': 'DOUBLE'
+        }
+        records = [
+            {
+                'Dimensions': [{'Name': 'metricType', 'Value': key}],
+                'MeasureValue': str(value)
+            }
+            for key, value in event.get('metrics', {}).items()
+        ]
         
         if records:
             timestream.write_records(
                 DatabaseName=event.get('database', 'iot_demo_iot_db'),
                 TableName=event.get('table', 'device_metrics'),
+                CommonAttributes=common_attributes,
                 Records=records
             )
     except Exception as e:
-        print(f"Error writing to TimeStream: {str(e)}")
+        logger.warning("Error writing to TimeStream: %s", e)
     
     # 存储原始数据到S3
     try:
@@ -392,11 +399,11 @@ def lambda_handler(event, context):
         s3.put_object(
             Bucket=event.get('bucket', 'iot-demo-data-lake'),
             Key=key,
-            Body=json.dumps(event),
+            Body=json.dumps(event, separators=(',', ':')),
             ContentType='application/json'
         )
     except Exception as e:
-        print(f"Error writing to S3: {str(e)}")
+        logger.error("Error writing to S3: %s", e)
     
     return {
         'statusCode': 200,
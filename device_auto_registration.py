@@ -4,6 +4,7 @@ IoT Device Auto-Registration System
 Automatically register devices to AWS IoT Core based on unique hardware identifiers
 """
 import os
+import re
 import json
 import hashlib
 import subprocess
@@ -16,6 +17,9 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; used to extract the CPU serial from /proc/cpuinfo
+CPU_SERIAL_PATTERN = re.compile(r'Serial\s*:\s*([a-fA-F0-9]+)')
+
 class DeviceAutoRegistration:
     def __init__(self, region='us-east-1', registration_endpoint=None):
         self.region = region
@@ -29,8 +33,6 @@ class DeviceAutoRegistration:
         
     def get_hardware_id(self):
         """Generate absolutely unique 16-character device ID with multiple fallbacks"""
-        import re
-        
         # Priority 1: Hardware Serial Numbers
         try:
             # Motherboard serial
@@ -58,7 +60,7 @@ class DeviceAutoRegistration:
             with open('/proc/cpuinfo', 'r') as f:
                 cpu_info = f.read()
             # Extract CPU serial if available
-            cpu_serial = re.search(r'Serial\s*:\s*([a-fA-F0-9]+)', cpu_info)
+            cpu_serial = CPU_SERIAL_PATTERN.search(cpu_info)
             if cpu_serial:
                 device_id = hashlib.sha256(f"CPU-{cpu_serial.group(1)}".encode()).hexdigest()[:16]
                 logger.info(f"🔑 Device ID from CPU serial: {device_id}")
@@ -2,22 +2,31 @@ import json
 import boto3
 import time
 import os
+import logging
 from datetime import datetime
 
+logger = logging.getLogger()
+# 级别名不区分大小写，无法识别时回退到 INFO
+_log_level = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.setLevel(_log_level if isinstance(_log_level, int) else logging.INFO)
+
+# 从环境变量获取配置（冷启动时读取一次，热容器内复用）
+S3_BUCKET = os.environ.get('S3_BUCKET', 'iot-demo-data-lake-985539760410')
+TIMESTREAM_DB = os.environ.get('TIMESTREAM_DB', 'iot-demo_iot_db')
+TIMESTREAM_TABLE = os.environ.get('TIMESTREAM_TABLE', 'device_metrics')
+
+# 初始化客户端（模块级创建，热容器内跨调用复用）
+s3 = boto3.client('s3')
+timestream = boto3.client('timestream-write')
+
 def lambda_handler(event, context):
     """处理IoT数据的Lambda函数"""
     
-    print(f"收到事件: {json.dumps(event, indent=2)}")
-    
-    # 初始化客户端
-    s3 = boto3.client('s3')
-    
-    # 从环境变量获取配置
-    s3_bucket = os.environ.get('S3_BUCKET', 'iot-demo-data-lake-985539760410')
-    timestream_db = os.environ.get('TIMESTREAM_DB', 'iot-demo_iot_db')
-    timestream_table = os.environ.get('TIMESTREAM_TABLE', 'device_metrics')
+    # 完整事件已写入 S3，仅在 DEBUG 级别下才序列化到日志
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("收到事件: %s", json.dumps(event, indent=2))
     
-    print(f"使用 S3 存储桶: {s3_bucket}")
+    logger.info("使用 S3 存储桶: %s", S3_BUCKET)
     
     # 处理IoT消息
     device_id = event.get('deviceId', 'unknown')
@@ -25,50 +34,52 @@ def lambda_handler(event, context):
     
     # 尝试写入TimeStream (预期会失败，但不应阻止S3写入)
     try:
-        timestream = boto3.client('timestream-write')
-        records = []
-        for key, value in event.get('metrics', {}).items():
-            records.append({
-                'Time': timestamp,
-                'TimeUnit': 'MILLISECONDS',
-                'Dimensions': [
-                    {'Name': 'deviceId', 'Value': device_id},
-                    {'Name': 'metricType', 'Value': key}
-                ],
-                'MeasureName': 'value',
-                'MeasureValue': str(value),
-                'MeasureValueType': 'DOUBLE'
-            })
+        # 所有指标共享的字段只发送一次，每条记录只保留指标类型和值
+        common_attributes = {
+            'Time': timestamp,
+            'TimeUnit': 'MILLISECONDS',
+            'Dimensions': [{'Name': 'deviceId', 'Value': device_id}],
+            'MeasureName': 'value',
+            'MeasureValueType': 'DOUBLE'
+        }
+        records = [
+            {
+                'Dimensions': [{'Name': 'metricType', 'Value': key}],
+                'MeasureValue': str(value)
+            }
+            for key, value in event.get('metrics', {}).items()
+        ]
         
         if records:
             timestream.write_records(
-                DatabaseName=timestream_db,
-                TableName=timestream_table,
+                DatabaseName=TIMESTREAM_DB,
+                TableName=TIMESTREAM_TABLE,
+                CommonAttributes=common_attributes,
                 Records=records
             )
-            print("✅ 数据成功写入 TimeStream")
+            logger.info("✅ 数据成功写入 TimeStream")
     except Exception as e:
-        print(f"⚠️ TimeStream 写入失败（预期）: {str(e)}")
+        logger.warning("⚠️ TimeStream 写入失败（预期）: %s", e)
     
     # 存储原始数据到S3
     try:
         now = datetime.now()
         key = f"raw-data/{device_id}/{now.strftime('%Y/%m/%d')}/{timestamp}.json"
         
-        print(f"写入 S3: bucket={s3_bucket}, key={key}")
+        logger.info("写入 S3: bucket=%s, key=%s", S3_BUCKET, key)
         
         response = s3.put_object(
-            Bucket=s3_bucket,
+            Bucket=S3_BUCKET,
             Key=key,
-            Body=json.dumps(event, indent=2),
+            Body=json.dumps(event, separators=(',', ':')),
             ContentType='application/json'
         )
         
-        print(f"✅ 数据成功写入 S3: {key}")
-        print(f"S3 响应: {response.get('ETag', 'N/A')}")
+        logger.info("✅ 数据成功写入 S3: %s", key)
+        logger.info("S3 响应: %s", response.get('ETag', 'N/A'))
         
     except Exception as e:
-        print(f"❌ S3 写入失败: {str(e)}")
+        logger.error("❌ S3 写入失败: %s", e)
         raise e
     
     return {
@@ -14,6 +14,9 @@ from AWSIoTPythonSDK.MQTTLib import AWSIoTMQTTClient
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# MQTT 消息使用紧凑 JSON 编码，减少消息体积
+COMPACT_JSON_SEPARATORS = (',', ':')
+
 class IoTDeviceSimulator:
     def __init__(self, device_config_path="certificates/test-device-001-config.json"):
         """初始化 IoT 设备模拟器"""
@@ -87,7 +90,7 @@ class IoTDeviceSimulator:
     def send_telemetry(self, data):
         """发送遥测数据"""
         try:
-            message = json.dumps(data, indent=2)
+            message = json.dumps(data, separators=COMPACT_JSON_SEPARATORS)
             self.mqtt_client.publish(self.telemetry_topic, message, 1)
             logger.info(f"📡 发送数据到 {self.telemetry_topic}")
             logger.info(f"📊 数据内容: {json.dumps(data['metrics'], indent=2)}")
@@ -107,7 +110,7 @@ class IoTDeviceSimulator:
         }
         
         try:
-            message = json.dumps(status_data, indent=2)
+            message = json.dumps(status_data, separators=COMPACT_JSON_SEPARATORS)
             self.mqtt_client.publish(self.status_topic, message, 1)
             logger.info(f"📡 发送状态到 {self.status_topic}: {status}")
             return True
@@ -126,10 +129,11 @@ class IoTDeviceSimulator:
             # 发送初始状态
             self.send_status("online")
             
-            start_time = time.time()
+            # 使用单调时钟计算截止时间，不受系统时间校正影响
+            deadline = time.monotonic() + duration_seconds
             message_count = 0
             
-            while time.time() - start_time < duration_seconds:
+            while time.monotonic() < deadline:
                 # 生成并发送传感器数据
                 sensor_data = self.generate_sensor_data()
                 if self.send_telemetry(sensor_data):
@@ -139,7 +143,7 @@ class IoTDeviceSimulator:
                 if message_count % 5 == 0:
                     self.send_status("online")
                     
-                logger.info(f"⏱️  已发送 {message_count} 条消息，剩余时间: {int(duration_seconds - (time.time() - start_time))} 秒")
+                logger.info(f"⏱️  已发送 {message_count} 条消息，剩余时间: {int(deadline - time.monotonic())} 秒")
                 time.sleep(interval_seconds)
                 
             # 发送离线状态
@@ -5,6 +5,7 @@
 import boto3
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 class DataFlowMonitor:
@@ -50,6 +51,12 @@ class DataFlowMonitor:
             print(f"❌ 获取 Lambda 日志失败: {str(e)}")
             return 0
             
+    def read_s3_json(self, key):
+        """读取并解析 S3 中的 JSON 数据文件"""
+        file_response = self.s3.get_object(Bucket=self.s3_bucket, Key=key)
+        content = file_response['Body'].read().decode('utf-8')
+        return json.loads(content)
+            
     def check_s3_data(self):
         """检查 S3 中的数据"""
         print(f"🗂️  检查 S3 存储桶: {self.s3_bucket}")
@@ -65,15 +72,19 @@ class DataFlowMonitor:
             objects = response.get('Contents', [])
             print(f"📁 找到 {len(objects)} 个数据文件")
             
+            recent_objects = sorted(objects, key=lambda x: x['LastModified'], reverse=True)[:5]
+            
+            # 并发读取文件内容，下面仍按时间顺序输出
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = [executor.submit(self.read_s3_json, obj['Key']) for obj in recent_objects]
+            
             # 显示最近的文件
-            for obj in sorted(objects, key=lambda x: x['LastModified'], reverse=True)[:5]:
+            for obj, future in zip(recent_objects, futures):
                 print(f"📄 {obj['Key']} - {obj['LastModified']} ({obj['Size']} bytes)")
                 
-                # 读取并显示文件内容
+                # 显示文件内容
                 try:
-                    file_response = self.s3.get_object(Bucket=self.s3_bucket, Key=obj['Key'])
-                    content = file_response['Body'].read().decode('utf-8')
-                    data = json.loads(content)
+                    data = future.result()
                     
                     print(f"   📊 设备: {data.get('deviceId', 'unknown')}")
                     metrics = data.get('metrics', {})
@@ -113,10 +124,11 @@ class DataFlowMonitor:
         print(f"🚀 开始实时监控 - 持续 {duration_minutes} 分钟，每 {check_interval} 秒检查一次")
         print("=" * 60)
         
-        start_time = time.time()
+        # 使用单调时钟计算截止时间，不受系统时间校正影响
+        deadline = time.monotonic() + duration_minutes * 60
         check_count = 0
         
-        while time.time() - start_time < duration_minutes * 60:
+        while time.monotonic() < deadline:
             check_count += 1
             print(f"\n🔄 第 {check_count} 次检查 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
             print("-" * 50)
@@ -16,16 +16,22 @@ logger = logging.getLogger(__name__)
 class AWSResourceHelper:
     """AWS资源辅助类"""
     
-    def __init__(self, region: str = 'us-east-1'):
+    def __init__(self, region: str = 'us-east-1', session: Optional[boto3.Session] = None):
         """初始化辅助类"""
         self.region = region
+        # 所有客户端共用同一个Session，避免重复解析配置和凭证；
+        # 未传入时沿用 boto3.setup_default_session() 设置的默认Session，
+        # 与 --profile 入口及本模块其他辅助类使用同一套凭证
+        self.session = session or boto3.DEFAULT_SESSION or boto3.Session(region_name=region)
         self.account_id = None
+        self._available_services = None
+        self.ssm = self.session.client('ssm', region_name=region)
         self._get_account_id()
     
     def _get_account_id(self):
         """获取AWS账户ID"""
         try:
-            sts = boto3.client('sts')
+            sts = self.session.client('sts', region_name=self.region)
             self.account_id = sts.get_caller_identity()['Account']
         except Exception as e:
             logger.error(f"获取账户ID失败: {str(e)}")
@@ -73,9 +79,7 @@ class AWSResourceHelper:
                                       description: str = "", secure: bool = False) -> bool:
         """创建或更新SSM参数"""
         try:
-            ssm = boto3.client('ssm', region_name=self.region)
-            
-            ssm.put_parameter(
+            self.ssm.put_parameter(
                 Name=name,
                 Value=value,
                 Description=description,
@@ -89,11 +93,16 @@ class AWSResourceHelper:
             logger.error(f"创建/更新SSM参数失败: {str(e)}")
             return False
     
+    def _get_available_services(self) -> frozenset:
+        """获取可用服务集合（首次调用时加载并缓存）"""
+        if self._available_services is None:
+            self._available_services = frozenset(self.session.get_available_services())
+        return self._available_services
+    
     def check_service_availability(self, service_name: str) -> bool:
         """检查AWS服务在当前区域是否可用"""
         try:
-            session = boto3.Session(region_name=self.region)
-            available_services = session.get_available_services()
+            available_services = self._get_available_services()
             
             if service_name in available_services:
                 logger.info(f"服务 {service_name} 在区域 {self.region} 可用")
@@ -155,6 +164,7 @@ class IoTDeviceHelper:
     def __init__(self, iot_client, region: str):
         self.iot = iot_client
         self.region = region
+        self.iot_data = boto3.client('iot-data', region_name=region)
     
     def create_thing_with_certificate(self, thing_name: str, thing_type: str, 
                                     policy_name: str, attributes: Dict[str, str]) -> Dict[str, str]:
@@ -200,15 +210,13 @@ class IoTDeviceHelper:
     def update_device_shadow(self, thing_name: str, desired_state: Dict[str, Any]) -> bool:
         """更新设备影子"""
         try:
-            iot_data = boto3.client('iot-data', region_name=self.region)
-            
             payload = {
                 'state': {
                     'desired': desired_state
                 }
             }
             
-            iot_data.update_thing_shadow(
+            self.iot_data.update_thing_shadow(
                 thingName=thing_name,
                 payload=json.dumps(payload)
             )